@@ -15,6 +15,12 @@ class ReceivedKudoInline(admin.TabularInline):
     readonly_fields = ('sender', 'message', 'created_at')
     can_delete = False
 
+    def get_queryset(self, request):
+        """
+        Join the users so the readonly 'sender' column doesn't query per row.
+        """
+        return super().get_queryset(request).select_related('sender', 'receiver')
+
 class SentKudoInline(admin.TabularInline):
     """
     Inline admin for displaying Kudos sent by a user
@@ -26,6 +32,12 @@ class SentKudoInline(admin.TabularInline):
     readonly_fields = ('receiver', 'message', 'created_at')
     can_delete = False
 
+    def get_queryset(self, request):
+        """
+        Join the users so the readonly 'receiver' column doesn't query per row.
+        """
+        return super().get_queryset(request).select_related('sender', 'receiver')
+
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
     """
@@ -59,4 +71,13 @@ class KudoAdmin(admin.ModelAdmin):
     Displays sender, receiver, message, and timestamp.
     """
     list_display = ('id', 'sender', 'receiver', 'message', 'created_at')
+    list_select_related = ('sender', 'receiver')  # Single JOIN instead of a query per row
+    raw_id_fields = ('sender', 'receiver')  # Lookup popup instead of loading all users
     readonly_fields = ('created_at',)
+
+    def get_queryset(self, request):
+        """
+        Fetch sender and receiver alongside each Kudo so the
+        change form and changelist don't query users separately.
+        """
+        return super().get_queryset(request).select_related('sender', 'receiver')
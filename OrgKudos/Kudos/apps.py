@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class KudosConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'Kudos'
+
+    def ready(self):
+        # Register the handlers that keep User.kudos_this_week in step with Kudo rows
+        from . import signals  # noqa: F401
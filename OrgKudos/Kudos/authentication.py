@@ -0,0 +1,68 @@
+"""
+Authentication classes for the Kudos application.
+
+Both authentication paths load the user together with their organization, so views
+and serializers that show the organization name (MeView, UserSerializer) don't
+need a second query.
+
+Classes:
+    - OrganizationModelBackend: Session/login backend that joins the organization.
+    - OrganizationJWTAuthentication: JWT authentication that joins the organization.
+"""
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+
+class OrganizationModelBackend(ModelBackend):
+    """
+    ModelBackend that loads the session user with `select_related('organization')`.
+    """
+
+    def get_user(self, user_id):
+        UserModel = get_user_model()
+        try:
+            user = UserModel._default_manager.select_related('organization').get(pk=user_id)
+        except UserModel.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
+
+
+class OrganizationJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that loads the token's user with `select_related('organization')`.
+
+    Mirrors `JWTAuthentication.get_user` from djangorestframework_simplejwt 5.5.1
+    (pinned in requirements.txt) apart from the joined queryset, including the
+    CHECK_USER_IS_ACTIVE and CHECK_REVOKE_TOKEN checks. Re-sync this method with
+    upstream whenever simplejwt is upgraded; AuthenticationTests covers it.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+        try:
+            user = self.user_model.objects.select_related('organization').get(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except self.user_model.DoesNotExist as e:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found") from e
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        return user
@@ -13,6 +13,9 @@ Usage:
 Intended for use in development, testing, or demo environments.
 """
 from django.core.management.base import BaseCommand
+from django.contrib.auth.hashers import make_password
+from django.core.management.color import no_style
+from django.db import connection, transaction
 from Kudos.models import User, Organization, Kudo
 from faker import Faker
 import random
@@ -26,18 +29,20 @@ class Command(BaseCommand):
         - Creates a set of predefined organizations.
         - Generates fake users using the Faker library and assigns them to organizations.
         - (Optionally) generates random kudos between users.
+        - Runs teardown and seeding in a single transaction.
 
     The command prints the created usernames and passwords for easy testing.
     """
 
     help = 'Generate demo data for testing or demo purposes.'
 
+    @transaction.atomic
     def handle(self, *args, **kwargs):
         """
         Executes the data generation process.
 
         Steps:
-            1. Deletes all existing Kudo, User, and Organization records.
+            1. Truncates the Kudo, User, and Organization tables (and tables referencing them).
             2. Creates predefined organizations (Mitratech, Deloitte, Capgemini).
             3. Generates 7 users with fake usernames and a common demo password.
             4. Optionally, generates 10 random Kudos between users (currently commented out).
@@ -48,36 +53,47 @@ class Command(BaseCommand):
         fake = Faker()
 
         # Step 1: Clear all existing data
-        Kudo.objects.all().delete()
-        User.objects.all().delete()
-        Organization.objects.all().delete()
+        # Flush the tables directly (TRUNCATE ... RESTART IDENTITY CASCADE on PostgreSQL)
+        # instead of loading every row into Python to run ORM cascades and signals
+        tables = [model._meta.db_table for model in (Kudo, User, Organization)]
+        connection.ops.execute_sql_flush(
+            connection.ops.sql_flush(no_style(), tables, reset_sequences=True, allow_cascade=True)
+        )
 
         # Step 2: Create some predefined and random organizations
         org_list = ['Mitratech', 'Deloitte', 'Capgemini']
-        orgs = [Organization.objects.create(name=name) for name in org_list]
+        orgs = Organization.objects.bulk_create([Organization(name=name) for name in org_list])
 
         print("🔐 Generated Users (username / password):")
 
         users = []
 
         # Step 3: Create fake users and assign them to random organizations
+        password = "test1234"  # Use a common password for demo users
+        hashed_password = make_password(password)  # Hash once; every demo user shares it
         for _ in range(11):
-            username = fake.user_name()
-            password = "test1234"  # Use a common password for demo users
+            username = fake.unique.user_name()
             org = random.choice(orgs)
-            user = User.objects.create_user(username=username, password=password, organization=org)
+            user = User(username=username, password=hashed_password, organization=org)
             users.append(user)
             print(f" - {username} / {password}")
 
+        # Insert all users in batched INSERTs instead of one query per user
+        users = User.objects.bulk_create(users, batch_size=1000)
+
         # Step 4 (Optional): Create some random Kudos between users
         # Uncomment the block below to auto-generate Kudos
 
+        # kudos = []
         # for _ in range(10):
         #     sender, receiver = random.sample(users, 2)
-        #     Kudo.objects.create(
+        #     kudos.append(Kudo(
         #         sender=sender,
         #         receiver=receiver,
         #         message=fake.sentence()
-        #     )
+        #     ))
+        # Kudo.objects.bulk_create(kudos, batch_size=1000)
+        # bulk_create skips the kudo signal handlers; that's fine here because the new
+        # users (also bulk-created) have unfilled counters that get filled from Kudo rows on first read
 
         self.stdout.write(self.style.SUCCESS("✅ Demo data generated successfully."))
@@ -5,6 +5,15 @@ from django.utils import timezone
 from datetime import timedelta
 # Create your models here.
 
+WEEKLY_KUDOS_LIMIT = 3
+
+def start_of_week():
+    """
+    Returns the timezone-aware datetime of midnight on Monday of the current week.
+    """
+    now = timezone.now()
+    return (now - timedelta(days=now.weekday())).replace(hour=0, minute=0, second=0, microsecond=0)
+
 class Organization(models.Model):
     """
     Represents an organization or company.
@@ -27,21 +36,89 @@ class User(AbstractUser):
                     blank=True  # ✅ allow empty values in forms
                 )
 
+    # Denormalized weekly counter so kudos limits don't need a COUNT(*) per request.
+    # Kept in step with Kudo rows by the signal handlers in signals.py; a NULL
+    # week_start means the counter has never been filled (e.g. rows that predate
+    # these columns) and is filled from Kudo rows on first read.
+    kudos_this_week = models.PositiveSmallIntegerField(default=0)
+    week_start = models.DateField(null=True, blank=True)
+
+    def save(self, *args, **kwargs):
+        # A brand-new user has sent nothing, so their counter starts filled at 0
+        if self._state.adding and self.week_start is None:
+            self.week_start = start_of_week().date()
+        super().save(*args, **kwargs)
+
     def kudos_given_this_week(self):
         """
         Returns the number of kudos the user has given since the start of the current week.
+        Reads the denormalized counter; a counter from a previous week counts as 0.
+        An unfilled counter is filled from Kudo rows once, then read like any other.
+        """
+        if self.week_start is None:
+            self.sync_kudos_counter()
+            self.refresh_from_db(fields=['kudos_this_week', 'week_start'])
+        if self.week_start != start_of_week().date():
+            return 0
+        return self.kudos_this_week
+
+    def sync_kudos_counter(self):
+        """
+        Refills the weekly counter from Kudo rows when it was never filled or
+        belongs to a previous week. Does nothing once the counter is current.
         """
-        now = timezone.now()
-        start_of_week = now - timedelta(days=now.weekday())
-        start_of_week = start_of_week.replace(hour=0, minute=0, second=0, microsecond=0)
-        return self.sent_kudos.filter(created_at__gte=start_of_week).count()
+        week_start = start_of_week()
+        User.objects.filter(pk=self.pk).exclude(week_start=week_start.date()).update(
+            kudos_this_week=models.Subquery(
+                Kudo.objects.filter(sender=models.OuterRef('pk'), created_at__gte=week_start)
+                .order_by()
+                .annotate(total=models.Func(models.F('pk'), function='COUNT'))
+                .values('total')
+            ),
+            week_start=week_start.date(),
+        )
+
+    def reserve_kudo(self):
+        """
+        Claims one of this week's kudos for the user; call inside the transaction
+        that creates the Kudo.
+
+        A conditional no-op UPDATE locks the user's row only while the limit has
+        not been reached, so concurrent requests queue up behind it and re-check
+        the counter the first one's post_save handler incremented.
+        Returns True if a kudo was reserved, False if the weekly limit is used up.
+        """
+        self.sync_kudos_counter()
+        reserved = User.objects.filter(
+            pk=self.pk,
+            week_start=start_of_week().date(),
+            kudos_this_week__lt=WEEKLY_KUDOS_LIMIT,
+        ).update(kudos_this_week=models.F('kudos_this_week'))
+        return bool(reserved)
+
+    def record_kudo_change(self, created_at, delta):
+        """
+        Adjusts the weekly counter by `delta` for a kudo sent at `created_at`.
+        Kudos from earlier weeks are ignored; a stale counter is refilled from Kudo rows,
+        which already reflect the change.
+        """
+        week_start = start_of_week()
+        if created_at < week_start:
+            return
+        adjusted = User.objects.filter(
+            pk=self.pk,
+            week_start=week_start.date(),
+            kudos_this_week__gte=-delta,  # never drive the counter below 0
+        ).update(kudos_this_week=models.F('kudos_this_week') + delta)
+        if not adjusted:
+            self.sync_kudos_counter()
 
     def kudos_left(self):
         """
         Returns how many kudos this user has left to give this week.
-        Max allowed kudos per week is 3.
+        Max allowed kudos per week is `WEEKLY_KUDOS_LIMIT` (3).
         """
-        return max(0, 3 - self.kudos_given_this_week())
+        return max(0, WEEKLY_KUDOS_LIMIT - self.kudos_given_this_week())
 
 class Kudo(models.Model):
     """
@@ -52,6 +129,13 @@ class Kudo(models.Model):
     message = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Match the list views (filter by user, newest first) and the weekly limit lookup
+            models.Index(fields=['sender', '-created_at'], name='kudo_sender_ts'),
+            models.Index(fields=['receiver', '-created_at'], name='kudo_receiver_ts'),
+        ]
+
     def clean(self):
         """
         Custom validation: ensure sender and receiver belong to the same organization.
@@ -76,13 +76,13 @@ class KudoSerializer(serializers.ModelSerializer):
 
     Fields:
     - id: Kudo ID
-    - sender: Name of the user who sent the kudo (read-only)
-    - receiver: Name of the user who received the kudo (read-only)
+    - sender: Username of the user who sent the kudo (read-only)
+    - receiver: Username of the user who received the kudo (read-only)
     - message: Kudo message content
     - created_at: Timestamp of when the kudo was sent
     """
-    sender = serializers.StringRelatedField(read_only=True)
-    receiver = serializers.StringRelatedField(read_only=True)
+    sender = serializers.CharField(source='sender.username', read_only=True)
+    receiver = serializers.CharField(source='receiver.username', read_only=True)
 
     class Meta:
         model = Kudo
@@ -109,24 +109,29 @@ class GiveKudoSerializer(serializers.ModelSerializer):
 
     def __init__(self, *args, **kwargs):
         """
-        Dynamically filter the 'receiver' queryset to exclude the sender (current user).
+        Dynamically filter the 'receiver' queryset to users in the sender's organization,
+        excluding the sender (current user). Any other receiver fails lookup in this
+        queryset, so it is reported with the organization error message.
         """
         super().__init__(*args, **kwargs)
         request = self.context.get('request')
         if request and request.user.is_authenticated:
-            self.fields['receiver'].queryset = User.objects.exclude(id=request.user.id)
+            receiver = self.fields['receiver']
+            receiver.queryset = (
+                User.objects.filter(organization_id=request.user.organization_id)
+                .exclude(id=request.user.id)
+                .only('id', 'username', 'organization_id')
+            )
+            receiver.error_messages['does_not_exist'] = "Receiver must be in your organization."
 
     def validate(self, data):
         """
-        Validate that:
-        - The user has remaining kudos to give this week.
-        - The receiver is in the same organization.
+        Validate that the user has remaining kudos to give this week.
+        (The receiver's organization is already enforced by the 'receiver' queryset.)
         """
         user = self.context['request'].user
         if user.kudos_left() <= 0:
             raise serializers.ValidationError("You have no kudos left this week.")
-        if user.organization != data['receiver'].organization:
-            raise serializers.ValidationError("Receiver must be in your organization.")
         return data
 
     def create(self, validated_data):
@@ -0,0 +1,56 @@
+"""
+Signal handlers for the Kudos application.
+
+Keeps each sender's denormalized weekly counter (`User.kudos_this_week`) in step
+with the Kudo table for every ORM write path: creates, sender changes, and deletes
+from the API, the admin, the shell, and cascading deletes. `bulk_create`,
+`QuerySet.update()` and raw SQL skip these handlers; their rows are picked up
+the next time the counter is refilled (see `User.sync_kudos_counter`).
+"""
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Kudo, User
+
+
+@receiver(pre_save, sender=Kudo)
+def remember_original_sender(sender, instance, **kwargs):
+    """
+    Records the stored sender of an existing kudo so `count_saved_kudo` can move
+    its count when the sender is changed (e.g. in KudoAdmin).
+    """
+    instance._original_sender_id = None
+    if not instance._state.adding:
+        instance._original_sender_id = (
+            Kudo.objects.filter(pk=instance.pk).values_list('sender_id', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=Kudo)
+def count_saved_kudo(sender, instance, created, **kwargs):
+    """
+    Adds a newly created kudo to its sender's weekly counter, or moves the
+    count from the old sender to the new one when an existing kudo changes sender.
+    """
+    if created:
+        User(pk=instance.sender_id).record_kudo_change(instance.created_at, 1)
+        return
+    original_sender_id = getattr(instance, '_original_sender_id', None)
+    if original_sender_id is not None and original_sender_id != instance.sender_id:
+        User(pk=original_sender_id).record_kudo_change(instance.created_at, -1)
+        User(pk=instance.sender_id).record_kudo_change(instance.created_at, 1)
+
+
+@receiver(post_delete, sender=Kudo)
+def uncount_deleted_kudo(sender, instance, origin=None, **kwargs):
+    """
+    Gives a deleted kudo's slot back to its sender.
+
+    Skipped when the kudo is being cascade-deleted with its sender, whose counter
+    goes away with the row. Note that having this receiver disables Django's
+    fast-delete for Kudo, so cascades load the kudos and run one UPDATE per
+    kudo whose sender survives.
+    """
+    if isinstance(origin, User) and origin.pk == instance.sender_id:
+        return
+    User(pk=instance.sender_id).record_kudo_change(instance.created_at, -1)
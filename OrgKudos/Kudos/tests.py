@@ -1,3 +1,306 @@
+from datetime import date
+from unittest import mock
+
+from django.db import DatabaseError, connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from .models import Kudo, Organization, User, WEEKLY_KUDOS_LIMIT, start_of_week
 
 # Create your tests here.
+
+class WeeklyKudoLimitTests(TestCase):
+    """
+    Tests for the 3-per-week kudo limit enforced by `User.reserve_kudo()`
+    and `GiveKudoView`.
+    """
+
+    def setUp(self):
+        org = Organization.objects.create(name='Acme')
+        self.sender = User.objects.create_user(username='sender', password='pw', organization=org)
+        self.receiver = User.objects.create_user(username='receiver', password='pw', organization=org)
+        self.client = APIClient()
+        self.client.force_authenticate(self.sender)
+
+    def give_kudo(self):
+        return self.client.post(
+            reverse('give-kudo'),
+            {'receiver': self.receiver.pk, 'message': 'Thanks!'},
+        )
+
+    def test_fourth_kudo_in_a_week_is_rejected(self):
+        for _ in range(WEEKLY_KUDOS_LIMIT):
+            self.assertEqual(self.give_kudo().status_code, 201)
+
+        self.assertEqual(self.give_kudo().status_code, 400)
+        self.assertEqual(Kudo.objects.filter(sender=self.sender).count(), WEEKLY_KUDOS_LIMIT)
+        self.sender.refresh_from_db()
+        self.assertEqual(self.sender.kudos_this_week, WEEKLY_KUDOS_LIMIT)
+
+    def test_counter_from_earlier_week_restarts(self):
+        User.objects.filter(pk=self.sender.pk).update(
+            kudos_this_week=WEEKLY_KUDOS_LIMIT, week_start=date(2000, 1, 3)
+        )
+
+        self.assertEqual(self.give_kudo().status_code, 201)
+        self.sender.refresh_from_db()
+        self.assertEqual(self.sender.kudos_this_week, 1)
+        self.assertEqual(self.sender.week_start, start_of_week().date())
+
+    def test_reserve_fails_when_stale_instance_misses_used_up_limit(self):
+        stale_sender = User.objects.get(pk=self.sender.pk)
+        self.assertEqual(stale_sender.kudos_left(), WEEKLY_KUDOS_LIMIT)
+        User.objects.filter(pk=self.sender.pk).update(
+            kudos_this_week=WEEKLY_KUDOS_LIMIT, week_start=start_of_week().date()
+        )
+
+        self.assertEqual(stale_sender.kudos_left(), WEEKLY_KUDOS_LIMIT)
+        self.assertFalse(stale_sender.reserve_kudo())
+
+    def test_counter_rolls_back_when_kudo_insert_fails(self):
+        self.assertEqual(self.give_kudo().status_code, 201)
+        original_save = Kudo.save
+
+        def save_then_fail(kudo, *args, **kwargs):
+            original_save(kudo, *args, **kwargs)
+            raise DatabaseError('insert failed')
+
+        with mock.patch.object(Kudo, 'save', save_then_fail):
+            with self.assertRaises(DatabaseError):
+                self.give_kudo()
+
+        self.sender.refresh_from_db()
+        self.assertEqual(self.sender.kudos_this_week, 1)
+        self.assertEqual(Kudo.objects.filter(sender=self.sender).count(), 1)
+
+
+class KudoCounterSyncTests(TestCase):
+    """
+    Tests that the signal handlers keep `User.kudos_this_week` in step with Kudo rows.
+    """
+
+    def setUp(self):
+        org = Organization.objects.create(name='Acme')
+        self.alice = User.objects.create_user(username='alice', password='pw', organization=org)
+        self.bob = User.objects.create_user(username='bob', password='pw', organization=org)
+        self.carol = User.objects.create_user(username='carol', password='pw', organization=org)
+
+    def assertCounter(self, user, expected):
+        user.refresh_from_db()
+        self.assertEqual(user.kudos_this_week, expected)
+        self.assertEqual(user.week_start, start_of_week().date())
+
+    def test_admin_sender_change_moves_the_count(self):
+        Kudo.objects.create(sender=self.alice, receiver=self.carol, message='One')
+        kudo = Kudo.objects.create(sender=self.alice, receiver=self.carol, message='Two')
+        admin_user = User.objects.create_superuser(username='admin', password='pw')
+        self.client.force_login(admin_user)
+
+        response = self.client.post(
+            reverse('admin:Kudos_kudo_change', args=[kudo.pk]),
+            {'sender': self.bob.pk, 'receiver': self.carol.pk, 'message': 'Two'},
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertCounter(self.alice, 1)
+        self.assertCounter(self.bob, 1)
+
+    def test_deleting_a_kudo_gives_the_slot_back(self):
+        kudo = Kudo.objects.create(sender=self.alice, receiver=self.bob, message='Thanks!')
+        self.assertCounter(self.alice, 1)
+
+        kudo.delete()
+
+        self.assertCounter(self.alice, 0)
+
+    def test_deleting_a_sender_skips_their_own_counter(self):
+        Kudo.objects.create(sender=self.alice, receiver=self.bob, message='One')
+        Kudo.objects.create(sender=self.alice, receiver=self.carol, message='Two')
+        Kudo.objects.create(sender=self.bob, receiver=self.alice, message='Three')
+
+        with CaptureQueriesContext(connection) as queries:
+            self.alice.delete()
+
+        counter_updates = [
+            q['sql'] for q in queries
+            if q['sql'].startswith('UPDATE') and 'kudos_this_week' in q['sql']
+        ]
+        self.assertEqual(len(counter_updates), 1)  # bob's kudo to alice only
+        self.assertCounter(self.bob, 0)
+
+    def test_new_user_counter_starts_filled(self):
+        self.assertEqual(self.alice.week_start, start_of_week().date())
+        with self.assertNumQueries(0):
+            self.assertEqual(self.alice.kudos_left(), WEEKLY_KUDOS_LIMIT)
+
+    def test_unfilled_counter_is_filled_once_from_kudo_rows(self):
+        Kudo.objects.bulk_create([
+            Kudo(sender=self.alice, receiver=self.bob, message='One'),
+            Kudo(sender=self.alice, receiver=self.carol, message='Two'),
+        ])
+        User.objects.filter(pk=self.alice.pk).update(kudos_this_week=0, week_start=None)
+        alice = User.objects.get(pk=self.alice.pk)
+
+        self.assertEqual(alice.kudos_left(), WEEKLY_KUDOS_LIMIT - 2)
+        with self.assertNumQueries(0):
+            self.assertEqual(alice.kudos_left(), WEEKLY_KUDOS_LIMIT - 2)
+        self.assertCounter(alice, 2)
+
+
+class MeViewETagTests(TestCase):
+    """
+    Tests for MeView's ETag / conditional GET handling.
+    """
+
+    def setUp(self):
+        self.org = Organization.objects.create(name='Acme')
+        self.user = User.objects.create_user(username='alice', password='pw', organization=self.org)
+        self.receiver = User.objects.create_user(username='bob', password='pw', organization=self.org)
+        self.client.force_login(self.user)
+
+    def test_unchanged_profile_returns_304_without_kudo_queries(self):
+        etag = self.client.get(reverse('me'))['ETag']
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('me'), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse([q for q in queries if 'Kudos_kudo' in q['sql']])
+
+    def test_sending_a_kudo_changes_the_etag(self):
+        etag = self.client.get(reverse('me'))['ETag']
+        Kudo.objects.create(sender=self.user, receiver=self.receiver, message='Thanks!')
+
+        response = self.client.get(reverse('me'), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['kudos_left'], WEEKLY_KUDOS_LIMIT - 1)
+
+    def test_renaming_the_organization_changes_the_etag(self):
+        etag = self.client.get(reverse('me'))['ETag']
+        Organization.objects.filter(pk=self.org.pk).update(name='Renamed')
+
+        response = self.client.get(reverse('me'), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['organization'], 'Renamed')
+
+
+class AuthenticationTests(TestCase):
+    """
+    Tests for the authentication classes that join the user's organization.
+    """
+
+    def setUp(self):
+        org = Organization.objects.create(name='Acme')
+        self.user = User.objects.create_user(username='alice', password='pw', organization=org)
+
+    def test_session_from_plain_model_backend_still_resolves(self):
+        self.client.force_login(self.user, backend='django.contrib.auth.backends.ModelBackend')
+
+        response = self.client.get(reverse('me'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['username'], 'alice')
+
+    def obtain_access_token(self):
+        response = self.client.post(reverse('token-obtain'), {'username': 'alice', 'password': 'pw'})
+        self.assertEqual(response.status_code, 200)
+        return response.json()['access']
+
+    def test_bearer_token_loads_user_and_organization_in_one_query(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.obtain_access_token()}')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(reverse('me'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['organization'], 'Acme')
+        self.assertEqual(len(queries), 1)
+        self.assertIn('Kudos_organization', queries[0]['sql'])
+
+    def test_bearer_token_of_inactive_user_is_rejected(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.obtain_access_token()}')
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        self.assertEqual(client.get(reverse('me')).status_code, 401)
+
+
+class GiveKudoReceiverTests(TestCase):
+    """
+    Tests for the organization-scoped receiver field of GiveKudoSerializer.
+    """
+
+    def setUp(self):
+        org = Organization.objects.create(name='Acme')
+        self.sender = User.objects.create_user(username='alice', password='pw', organization=org)
+        self.colleague = User.objects.create_user(username='bob', password='pw', organization=org)
+        outsider_org = Organization.objects.create(name='Other')
+        self.outsider = User.objects.create_user(username='eve', password='pw', organization=outsider_org)
+        self.client = APIClient()
+        self.client.force_authenticate(self.sender)
+
+    def give_kudo(self, receiver):
+        return self.client.post(reverse('give-kudo'), {'receiver': receiver.pk, 'message': 'Thanks!'})
+
+    def test_receiver_in_same_organization_is_accepted(self):
+        self.assertEqual(self.give_kudo(self.colleague).status_code, 201)
+
+    def test_receiver_outside_organization_is_rejected(self):
+        response = self.give_kudo(self.outsider)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'receiver': ['Receiver must be in your organization.']})
+        self.assertFalse(Kudo.objects.exists())
+
+    def test_sender_cannot_give_kudo_to_self(self):
+        self.assertEqual(self.give_kudo(self.sender).status_code, 400)
+        self.assertFalse(Kudo.objects.exists())
+
+
+class KudoListViewTests(TestCase):
+    """
+    Tests for the cursor-paginated kudo list views and their narrow, joined queries.
+    """
+
+    def setUp(self):
+        org = Organization.objects.create(name='Acme')
+        self.alice = User.objects.create_user(username='alice', password='pw', organization=org)
+        self.bob = User.objects.create_user(username='bob', password='pw', organization=org)
+        self.client = APIClient()
+
+    def test_given_kudos_are_paginated_newest_first(self):
+        Kudo.objects.bulk_create(
+            [Kudo(sender=self.alice, receiver=self.bob, message=f'Kudo {i}') for i in range(51)]
+        )
+        self.client.force_authenticate(self.alice)
+
+        first_page = self.client.get(reverse('kudos-given')).json()
+        second_page = self.client.get(first_page['next']).json()
+
+        self.assertEqual(len(first_page['results']), 50)
+        self.assertIsNone(first_page['previous'])
+        self.assertEqual(len(second_page['results']), 1)
+        self.assertIsNone(second_page['next'])
+        ids = [kudo['id'] for kudo in first_page['results'] + second_page['results']]
+        self.assertEqual(ids, sorted(ids, reverse=True))
+        self.assertEqual(len(set(ids)), 51)
+
+    def test_list_views_use_a_single_narrow_query(self):
+        Kudo.objects.create(sender=self.alice, receiver=self.bob, message='Thanks!')
+        for user, url_name in ((self.alice, 'kudos-given'), (self.bob, 'kudos-received')):
+            with self.subTest(url_name):
+                self.client.force_authenticate(user)
+
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(reverse(url_name))
+
+                self.assertEqual(len(queries), 1)
+                self.assertNotIn('password', queries[0]['sql'])
+                kudo = response.json()['results'][0]
+                self.assertEqual(set(kudo), {'id', 'sender', 'receiver', 'message', 'created_at'})
+                self.assertEqual((kudo['sender'], kudo['receiver']), ('alice', 'bob'))
@@ -2,12 +2,15 @@
 URL configuration for the Kudos application.
 
 This module defines URL patterns for user authentication, user profile, and kudo-related views.
-All views are implemented as class-based views imported from `views.py`.
+All views are implemented as class-based views explicitly imported from `views.py`
+(token views come from `rest_framework_simplejwt`).
 
 Routes:
     - '' (home): Renders the homepage.
     - 'signup/': Handles user registration.
-    - 'login/': Handles user login.
+    - 'login/': Handles user login (session-based, for the HTML pages).
+    - 'token/': Issues a JWT access/refresh pair for API clients.
+    - 'token/refresh/': Exchanges a refresh token for a new access token.
     - 'logout/': Logs out the authenticated user.
     - 'me/': Retrieves the current authenticated user's profile.
     - 'kudos/received/': Lists kudos received by the user.
@@ -15,12 +18,24 @@ Routes:
     - 'kudos/give/': Allows the user to give kudos to another user.
 """
 from django.urls import path
-from .views import *
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from .views import (
+    HomePageView,
+    SignupView,
+    LoginView,
+    LogoutView,
+    MeView,
+    KudosReceivedView,
+    KudosGivenView,
+    GiveKudoView,
+)
 
 urlpatterns = [
     path('', HomePageView.as_view(), name='home'),
     path('signup/', SignupView.as_view(), name='signup'),
     path('login/', LoginView.as_view(), name='login'),
+    path('token/', TokenObtainPairView.as_view(), name='token-obtain'),
+    path('token/refresh/', TokenRefreshView.as_view(), name='token-refresh'),
     path('logout/', LogoutView.as_view(), name='logout'),
     path('me/', MeView.as_view(), name='me'),
     path('kudos/received/', KudosReceivedView.as_view(), name='kudos-received'),
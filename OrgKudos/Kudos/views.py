@@ -19,27 +19,55 @@ Dependencies:
     - rest_framework
     - django.contrib.auth
     - django.shortcuts
-    - django.utils.timezone
     - kudos_app.models
     - kudos_app.serializers
 """
 
+import hashlib
 
 from rest_framework import serializers
 from rest_framework.response import Response
 from rest_framework import generics, status, permissions
+from rest_framework.pagination import CursorPagination
 from django.views.generic import TemplateView
 from django.contrib import messages
 from django.shortcuts import redirect
 from django.contrib.auth import login, logout
+from django.db import transaction
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from .serializers import SignupSerializer, LoginSerializer
-from datetime import timedelta
-from django.utils import timezone
-from .models import Kudo
+from .models import Kudo, start_of_week
 from .serializers import KudoSerializer, GiveKudoSerializer, UserSerializer
 
 # Create your views here.
 
+# Columns KudoSerializer actually renders; keeps the list queries narrow
+KUDO_LIST_FIELDS = ('id', 'message', 'created_at', 'sender__username', 'receiver__username')
+
+class KudoCursorPagination(CursorPagination):
+    """
+    Cursor pagination for kudo lists, newest first.
+    Each page is an index range scan on (user, -created_at), independent of history length.
+    """
+    page_size = 50
+    ordering = '-created_at'
+
+def me_etag(request, *args, **kwargs):
+    """
+    Builds the ETag for MeView from stored fields already loaded on `request.user`
+    (the organization is joined at authentication), so computing it never queries.
+    The current week is part of the tag since kudos_left resets every Monday.
+    The parts are hashed to keep names with quotes or non-ASCII characters out of the header.
+    """
+    user = request.user
+    organization = user.organization.name if user.organization_id else ''
+    parts = '\0'.join(str(part) for part in (
+        user.pk, user.username, organization,
+        user.kudos_this_week, user.week_start, start_of_week().date(),
+    ))
+    return hashlib.md5(parts.encode(), usedforsecurity=False).hexdigest()
+
 class HomePageView(TemplateView):
     """
     Renders the homepage of the Kudos application.
@@ -118,7 +146,7 @@ class MeView(generics.RetrieveAPIView):
     API view to retrieve details of the currently authenticated user.
 
     Methods:
-        get: Returns serialized user data.
+        get: Returns serialized user data, or 304 if the client's ETag still matches.
     
     Permissions:
         IsAuthenticated
@@ -126,7 +154,12 @@ class MeView(generics.RetrieveAPIView):
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAuthenticated]
 
+    @method_decorator(condition(etag_func=me_etag))
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
     def get_object(self):
+        # Already loaded with its organization by the authentication backend/class
         return self.request.user
 
 class KudosReceivedView(generics.ListAPIView):
@@ -134,32 +167,44 @@ class KudosReceivedView(generics.ListAPIView):
     API view to list kudos received by the another user.
 
     Methods:
-        get_queryset: Returns kudos where the current user is the receiver.
+        get_queryset: Returns kudos where the current user is the receiver, paginated newest first.
     
     Permissions:
         IsAuthenticated
     """
     serializer_class = KudoSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KudoCursorPagination
 
     def get_queryset(self):
-        return self.request.user.received_kudos.order_by('-created_at')
+        return (
+            self.request.user.received_kudos
+            .select_related('sender', 'receiver')
+            .only(*KUDO_LIST_FIELDS)
+            .order_by('-created_at')
+        )
 
 class KudosGivenView(generics.ListAPIView):
     """
     API view to list kudos given by the authenticated user.
 
     Methods:
-        get_queryset: Returns kudos sent by the current user.
+        get_queryset: Returns kudos sent by the current user, paginated newest first.
     
     Permissions:
         IsAuthenticated
     """
     serializer_class = KudoSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KudoCursorPagination
 
     def get_queryset(self):
-        return Kudo.objects.filter(sender=self.request.user).order_by('-created_at')
+        return (
+            Kudo.objects.filter(sender=self.request.user)
+            .select_related('sender', 'receiver')
+            .only(*KUDO_LIST_FIELDS)
+            .order_by('-created_at')
+        )
 
 
 class GiveKudoView(generics.CreateAPIView):
@@ -167,11 +212,12 @@ class GiveKudoView(generics.CreateAPIView):
     API view for sending kudos to another user.
 
     Methods:
-        perform_create: Validates weekly kudo limit and organization match before saving.
+        perform_create: Atomically reserves one of the weekly kudos before saving.
 
     Business Rules:
         - Users can give a maximum of 3 kudos per week.
-        - Users can only give kudos to others in the same organization.
+        - Users can only give kudos to others in the same organization
+          (enforced by GiveKudoSerializer's receiver queryset).
 
     Permissions:
         IsAuthenticated
@@ -182,21 +228,10 @@ class GiveKudoView(generics.CreateAPIView):
     def perform_create(self, serializer):
         user = self.request.user
 
-        # Count kudos given this week
-        today = timezone.now().date()
-        start_of_week = today - timedelta(days=today.weekday())
-
-        kudos_this_week = Kudo.objects.filter(
-            sender=user,
-            created_at__date__gte=start_of_week
-        ).count()
-
-        if kudos_this_week >= 3:
-            raise serializers.ValidationError("You have already given 3 kudos this week.")
-
-        # Validate org match again for extra safety
-        receiver = serializer.validated_data.get('receiver')
-        if receiver.organization != user.organization:
-            raise serializers.ValidationError("Receiver must be in your organization.")
-
-        serializer.save(sender=user)
\ No newline at end of file
+        # Claim the kudo and insert it together; the conditional UPDATE enforces
+        # the weekly limit even when requests race past GiveKudoSerializer.validate,
+        # and the post_save handler counts the new kudo in the same transaction
+        with transaction.atomic():
+            if not user.reserve_kudo():
+                raise serializers.ValidationError("You have already given 3 kudos this week.")
+            serializer.save(sender=user)
\ No newline at end of file
@@ -39,6 +39,7 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'rest_framework',
+    'rest_framework_simplejwt',
     'Kudos',
 ]
 
@@ -84,6 +85,20 @@ DATABASES = {
 }
 
 
+# Password hashing
+# https://docs.djangoproject.com/en/4.2/topics/auth/passwords/#using-argon2-with-django
+# Argon2 is cheaper per signup than PBKDF2 at comparable strength; the other
+# hashers remain so existing PBKDF2 hashes still verify and are upgraded on login.
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -127,8 +142,18 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 AUTH_USER_MODEL = 'Kudos.User'
 
+# New logins go through the backend that loads the user together with their organization
+# (see Kudos/authentication.py); ModelBackend stays so sessions created before it still resolve
+AUTHENTICATION_BACKENDS = [
+    'Kudos.authentication.OrganizationModelBackend',
+    'django.contrib.auth.backends.ModelBackend',
+]
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
+        # API clients send a Bearer token, which is verified without a django_session lookup
+        'Kudos.authentication.OrganizationJWTAuthentication',
+        # Kept for the HTML pages and browsable API, which log in through LoginView
         'rest_framework.authentication.SessionAuthentication',
     ]
 }
\ No newline at end of file